@@ -5,9 +5,6 @@ import logging
 import sys
 from pathlib import Path
 
-from .config import ProxyConfig
-from .server import create_server
-
 
 def main() -> None:
     """Main entry point."""
@@ -41,10 +38,15 @@ def main() -> None:
         stream=sys.stderr,
     )
 
+    # Imported here so --help and argument errors don't pay for loading
+    # yaml and the MCP SDK
+    from .config import ProxyConfig
+    from .server import create_server
+
     # Load configuration
     try:
         config = ProxyConfig.load(args.config)
-    except FileNotFoundError as e:
+    except (FileNotFoundError, ValueError) as e:
         logging.error(f"Configuration error: {e}")
         sys.exit(1)
 
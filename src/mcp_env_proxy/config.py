@@ -1,35 +1,163 @@
 """Configuration management for MCP Environment Proxy."""
 
+import functools
 import os
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 
-import yaml
-from pydantic import BaseModel, Field
 
+@functools.lru_cache(maxsize=8)
+def _parse_yaml(path: str, mtime_ns: int, size: int) -> dict[str, Any]:
+    """Parse a YAML config file.
 
-class ServerConfig(BaseModel):
+    Memoized on the file's mtime and size, so an edited file is re-parsed
+    while repeated loads of an unchanged file skip YAML parsing entirely.
+    """
+    import yaml
+
+    # Prefer the libyaml-backed loader; it parses raw bytes without a
+    # Python-level decode pass.
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    with open(path, "rb") as f:
+        return yaml.load(f, Loader=loader) or {}
+
+
+def _mapping(value: Any, what: str) -> dict[Any, Any]:
+    """Check that a YAML value is a mapping, treating a missing one as empty."""
+    if value is None:
+        return {}
+    if not isinstance(value, dict):
+        raise ValueError(f"{what} must be a mapping")
+    return value
+
+
+def _scalar_str(value: Any, what: str) -> str:
+    """Convert a YAML string or number to a string.
+
+    Empty values, booleans and nested structures are rejected rather than
+    turned into "None", "True" or a repr.
+    """
+    if isinstance(value, bool) or not isinstance(value, (str, int, float)):
+        raise ValueError(f"{what} must be a string or number, got {value!r}")
+    return str(value)
+
+
+def _optional_str(value: Any, what: str) -> str | None:
+    """Check that a YAML value is a string or missing."""
+    if value is not None and not isinstance(value, str):
+        raise ValueError(f"{what} must be a string, got {value!r}")
+    return value
+
+
+def _str_dict(value: Any, what: str) -> dict[str, str]:
+    """Copy a YAML mapping of strings and numbers into a dict of strings."""
+    return {str(k): _scalar_str(v, f"{what}: {k!r}") for k, v in _mapping(value, what).items()}
+
+
+def _encode_env(env: dict[str, str]) -> dict[bytes, bytes]:
+    """Encode environment variables the way the OS expects them."""
+    return {os.fsencode(k): os.fsencode(v) for k, v in env.items()}
+
+
+@dataclass(slots=True)
+class ServerConfig:
     """Configuration for an MCP server type."""
 
     command: str
-    args: list[str] = Field(default_factory=list)
+    args: list[str] = field(default_factory=list)
 
 
-class ContextConfig(BaseModel):
+@dataclass(slots=True)
+class ContextConfig:
     """Configuration for a named context."""
 
     server: str
-    env: dict[str, str] = Field(default_factory=dict)
+    env: dict[str, str] = field(default_factory=dict)
     description: str | None = None
 
 
-class ProxyConfig(BaseModel):
+@dataclass(slots=True)
+class ProxyConfig:
     """Root configuration for the proxy."""
 
-    defaults: dict[str, str] = Field(default_factory=dict)
-    servers: dict[str, ServerConfig] = Field(default_factory=dict)
-    contexts: dict[str, ContextConfig] = Field(default_factory=dict)
+    defaults: dict[str, str] = field(default_factory=dict)
+    servers: dict[str, ServerConfig] = field(default_factory=dict)
+    contexts: dict[str, ContextConfig] = field(default_factory=dict)
     current_context: str | None = None
+    # Spawn every context's server and cache its tools at startup
+    prewarm: bool = False
+
+    # os.environ merged with defaults, built on first use
+    _base_env: dict[str, str] | None = field(default=None, init=False, repr=False, compare=False)
+    # Per-context build_env / get_command results
+    _env_cache: dict[str, dict[str, str]] = field(default_factory=dict, init=False, repr=False, compare=False)
+    _command_cache: dict[str, tuple[str, list[str]]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    # Bytes counterparts of _base_env / _env_cache, see build_spawn_env()
+    _base_env_bytes: dict[bytes, bytes] | None = field(default=None, init=False, repr=False, compare=False)
+    _spawn_env_cache: dict[str, dict[bytes, bytes]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    # Display form of each context's command line
+    _command_strings: dict[str, str] = field(default_factory=dict, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Precompute the command line shown for each context."""
+        self._command_strings = {
+            name: f"{server.command} {' '.join(server.args)}" if (server := self.servers.get(ctx.server)) else "unknown"
+            for name, ctx in self.contexts.items()
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "ProxyConfig":
+        """Build a configuration from parsed YAML data.
+
+        Only the structure the proxy relies on is checked. Every container
+        is copied, so the result never shares state with ``data``.
+
+        Raises:
+            ValueError: If the data does not have the expected shape
+        """
+        if not isinstance(data, dict):
+            raise ValueError("Configuration must be a mapping")
+
+        servers = {}
+        for name, server in _mapping(data.get("servers"), "servers").items():
+            if not isinstance(server, dict) or not isinstance(server.get("command"), str):
+                raise ValueError(f"Server {name!r} must define a command")
+            args = server.get("args")
+            if args is None:
+                args = []
+            elif not isinstance(args, list):
+                raise ValueError(f"args of server {name!r} must be a list, got {args!r}")
+            servers[name] = ServerConfig(
+                command=server["command"],
+                args=[_scalar_str(arg, f"args of server {name!r}: item") for arg in args],
+            )
+
+        contexts = {}
+        for name, ctx in _mapping(data.get("contexts"), "contexts").items():
+            if not isinstance(ctx, dict) or not isinstance(ctx.get("server"), str):
+                raise ValueError(f"Context {name!r} must define a server")
+            contexts[name] = ContextConfig(
+                server=ctx["server"],
+                env=_str_dict(ctx.get("env"), f"env of context {name!r}"),
+                description=_optional_str(ctx.get("description"), f"description of context {name!r}"),
+            )
+
+        prewarm = data.get("prewarm", False)
+        if not isinstance(prewarm, bool):
+            raise ValueError(f"prewarm must be true or false, got {prewarm!r}")
+
+        return cls(
+            defaults=_str_dict(data.get("defaults"), "defaults"),
+            servers=servers,
+            contexts=contexts,
+            current_context=_optional_str(data.get("current_context"), "current_context"),
+            prewarm=prewarm,
+        )
 
     @classmethod
     def load(cls, config_path: str | Path | None = None) -> "ProxyConfig":
@@ -43,6 +171,10 @@ class ProxyConfig(BaseModel):
 
         Returns:
             ProxyConfig instance
+
+        Raises:
+            FileNotFoundError: If the given config file does not exist
+            ValueError: If the config file is malformed
         """
         if config_path is None:
             config_path = os.environ.get("MCP_ENV_PROXY_CONFIG")
@@ -63,13 +195,16 @@ class ProxyConfig(BaseModel):
             return cls()
 
         config_path = Path(config_path)
-        if not config_path.exists():
-            raise FileNotFoundError(f"Config file not found: {config_path}")
+        try:
+            stat = config_path.stat()
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Config file not found: {config_path}") from None
 
-        with open(config_path) as f:
-            data = yaml.safe_load(f) or {}
+        data = _parse_yaml(str(config_path.resolve()), stat.st_mtime_ns, stat.st_size)
 
-        return cls.model_validate(data)
+        # from_dict copies every container, so the memoized dict is never
+        # shared with (or mutated through) the returned instance.
+        return cls.from_dict(data)
 
     def get_context(self, name: str) -> ContextConfig | None:
         """Get a context by name."""
@@ -79,24 +214,54 @@ class ProxyConfig(BaseModel):
         """Get a server config by name."""
         return self.servers.get(name)
 
+    def get_command_string(self, context_name: str) -> str:
+        """Get the command line of a context as a display string."""
+        return self._command_strings.get(context_name, "unknown")
+
     def build_env(self, context_name: str) -> dict[str, str]:
         """Build environment variables for a context.
 
-        Merges defaults with context-specific env vars.
+        Merges defaults with context-specific env vars. The result is cached
+        per context and shared between callers, so it must not be modified.
         """
+        env = self._env_cache.get(context_name)
+        if env is not None:
+            return env
+
         context = self.get_context(context_name)
         if context is None:
             raise ValueError(f"Context not found: {context_name}")
 
-        # Start with current environment
-        env = dict(os.environ)
+        # The process environment and defaults are fixed for the lifetime of
+        # the proxy, so merge them once and only layer the context on top.
+        if self._base_env is None:
+            self._base_env = dict(os.environ) | self.defaults
 
-        # Apply defaults
-        env.update(self.defaults)
+        env = self._env_cache[context_name] = self._base_env | context.env
+        return env
 
-        # Apply context-specific env
-        env.update(context.env)
+    def build_spawn_env(self, context_name: str) -> dict[str, str] | dict[bytes, bytes]:
+        """Build the environment to spawn a context's server process with.
 
+        Same variables as build_env(), but on POSIX they are built from
+        os.environb and encoded once, so subprocess doesn't re-encode the
+        whole environment on every spawn. Cached like build_env().
+        """
+        if not os.supports_bytes_environ:
+            return self.build_env(context_name)
+
+        env = self._spawn_env_cache.get(context_name)
+        if env is not None:
+            return env
+
+        context = self.get_context(context_name)
+        if context is None:
+            raise ValueError(f"Context not found: {context_name}")
+
+        if self._base_env_bytes is None:
+            self._base_env_bytes = dict(os.environb) | _encode_env(self.defaults)
+
+        env = self._spawn_env_cache[context_name] = self._base_env_bytes | _encode_env(context.env)
         return env
 
     def get_command(self, context_name: str) -> tuple[str, list[str]]:
@@ -105,6 +270,10 @@ class ProxyConfig(BaseModel):
         Returns:
             Tuple of (command, args)
         """
+        command = self._command_cache.get(context_name)
+        if command is not None:
+            return command
+
         context = self.get_context(context_name)
         if context is None:
             raise ValueError(f"Context not found: {context_name}")
@@ -113,4 +282,5 @@ class ProxyConfig(BaseModel):
         if server is None:
             raise ValueError(f"Server not found: {context.server}")
 
-        return server.command, server.args
+        command = self._command_cache[context_name] = (server.command, server.args)
+        return command
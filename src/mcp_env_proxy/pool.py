@@ -1,17 +1,54 @@
 """Process pool manager for MCP server subprocesses."""
 
 import asyncio
+import functools
 import logging
-import json
-from dataclasses import dataclass
-from typing import Any
+import subprocess
+import sys
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, TypeVar
+
+import orjson
 
 from .config import ProxyConfig
 
 logger = logging.getLogger(__name__)
 
-
-@dataclass
+T = TypeVar("T")
+
+# The handshake never changes, so it is serialized once. initialize is
+# always the first request on a process and uses id 0.
+_INITIALIZE_ID = 0
+_INITIALIZE_REQUEST = orjson.dumps({
+    "jsonrpc": "2.0",
+    "id": _INITIALIZE_ID,
+    "method": "initialize",
+    "params": {
+        "protocolVersion": "2024-11-05",
+        "capabilities": {},
+        "clientInfo": {"name": "mcp-env-proxy", "version": "0.1.0"}
+    }
+}) + b"\n"
+_INITIALIZED_NOTIFICATION = orjson.dumps({
+    "jsonrpc": "2.0",
+    "method": "notifications/initialized"
+}) + b"\n"
+
+# Templates for the per-call requests; only the id, tool name (as a JSON
+# string) and arguments (as a JSON object) are filled in per call
+_TOOLS_LIST_REQUEST = b'{"jsonrpc":"2.0","id":%d,"method":"tools/list","params":{}}\n'
+_TOOLS_CALL_REQUEST = b'{"jsonrpc":"2.0","id":%d,"method":"tools/call","params":{"name":%s,"arguments":%s}}\n'
+
+# Buffer limit for server stdout. Large tool responses (e.g. log events)
+# are then read in a few big chunks instead of many 64 KiB ones.
+_STDOUT_LIMIT = 1 << 20
+
+
+@dataclass(slots=True)
 class ToolInfo:
     """Information about an available tool."""
     name: str
@@ -19,24 +56,135 @@ class ToolInfo:
     input_schema: dict | None = None
 
 
+class ToolFetchError(RuntimeError):
+    """Raised when a context's tools can't be fetched from its server."""
+
+    def __init__(self, context_name: str, cause: BaseException):
+        super().__init__(f"Failed to fetch tools for {context_name}: {cause}")
+        self.context_name = context_name
+        self.cause = cause
+
+
+def _cancelling() -> bool:
+    """Whether cancellation of the current task was requested.
+
+    Task.cancelling() only exists on Python 3.11+; earlier versions
+    report False.
+    """
+    task = asyncio.current_task()
+    cancelling = getattr(task, "cancelling", None)
+    return cancelling is not None and cancelling() > 0
+
+
+class _ThreadSpawnedProcess:
+    """A subprocess.Popen started off the event loop, with asyncio pipes.
+
+    Provides the subset of asyncio.subprocess.Process the pool uses.
+    """
+
+    def __init__(
+        self,
+        popen: subprocess.Popen,
+        stdin: asyncio.StreamWriter,
+        stdout: asyncio.StreamReader,
+        stderr: asyncio.StreamReader
+    ):
+        self._popen = popen
+        self.stdin = stdin
+        self.stdout = stdout
+        self.stderr = stderr
+
+    @property
+    def returncode(self) -> int | None:
+        return self._popen.poll()
+
+    def terminate(self) -> None:
+        self._popen.terminate()
+
+    def kill(self) -> None:
+        self._popen.kill()
+
+    async def wait(self) -> int:
+        return await asyncio.get_running_loop().run_in_executor(None, self._popen.wait)
+
+
+@dataclass(slots=True)
+class ManagedProcess:
+    """A long-lived MCP server process serving one context."""
+    context_name: str
+    proc: asyncio.subprocess.Process | _ThreadSpawnedProcess
+    reader_task: asyncio.Task | None = None
+    stderr_task: asyncio.Task | None = None
+    pending: dict[int, asyncio.Future] = field(default_factory=dict)
+    next_id: int = _INITIALIZE_ID + 1
+
+    @property
+    def alive(self) -> bool:
+        """Whether the process's responses are still being read.
+
+        The reader stops at EOF on stdout, i.e. once the process exits.
+        """
+        return self.reader_task is not None and not self.reader_task.done()
+
+    def new_request_id(self) -> int:
+        """Allocate the next JSON-RPC request id."""
+        request_id = self.next_id
+        self.next_id += 1
+        return request_id
+
+
 class ProcessPool:
-    """Manages MCP server process invocations.
+    """Manages a pool of persistent MCP server processes.
 
-    Uses interactive communication with MCP servers, reading responses
-    line by line as they arrive.
+    Each context gets its own server process, spawned and initialized on
+    first use and then kept running, so later calls skip process startup
+    and the initialize handshake. Requests are multiplexed over the
+    process's stdio and matched to responses by JSON-RPC id.
     """
 
-    def __init__(self, config: ProxyConfig, max_processes: int = 5):
+    def __init__(
+        self,
+        config: ProxyConfig,
+        max_processes: int = 5,
+        max_cached_tools: int = 64,
+        tools_ttl: float = 300.0
+    ):
         """Initialize the process pool.
 
         Args:
             config: Proxy configuration
-            max_processes: Maximum number of concurrent processes (unused for now)
+            max_processes: Maximum number of processes kept running
+            max_cached_tools: Maximum number of contexts whose tool lists are cached
+            tools_ttl: Seconds before a cached tool list is fetched again
         """
         self.config = config
         self.max_processes = max_processes
+        self.max_cached_tools = max_cached_tools
+        self.tools_ttl = tools_ttl
         self._current_context: str | None = config.current_context
-        self._tools_cache: dict[str, list[ToolInfo]] = {}
+        # Least recently used first
+        self._processes: OrderedDict[str, ManagedProcess] = OrderedDict()
+        # Least recently used first, as (fetch time, tools, tool dicts for
+        # list_tool_schemas), so both views expire and evict together
+        self._tools_cache: OrderedDict[
+            str, tuple[float, list[ToolInfo], list[dict[str, Any]]]
+        ] = OrderedDict()
+        # The parts of list_contexts() that only depend on the config
+        self._context_info: list[dict[str, Any]] = [
+            {
+                "name": name,
+                "server": ctx.server,
+                "command": config.get_command_string(name),
+                "env": ctx.env,
+            }
+            for name, ctx in config.contexts.items()
+        ]
+        # In-flight process spawns and tool fetches, one task per context
+        self._spawning: dict[str, asyncio.Task[ManagedProcess]] = {}
+        self._fetching: dict[str, asyncio.Task[list[ToolInfo]]] = {}
+        # fork/exec runs here rather than on the event loop thread; created
+        # on first spawn and again after close()
+        self._spawn_executor: ThreadPoolExecutor | None = None
 
     @property
     def current_context(self) -> str | None:
@@ -51,6 +199,10 @@ class ProcessPool:
 
         Returns:
             Info about the new context including available tools
+
+        Raises:
+            ToolFetchError: If the context's tools can't be fetched; the
+                context is switched to regardless
         """
         if context_name not in self.config.contexts:
             raise ValueError(f"Unknown context: {context_name}")
@@ -58,175 +210,482 @@ class ProcessPool:
         self._current_context = context_name
         logger.info(f"Switched to context: {context_name}")
 
-        # Fetch tools for the new context
-        tools = await self._fetch_tools(context_name)
-        self._tools_cache[context_name] = tools
+        # A warm context needs no await; only fetch tools on a cache miss
+        entry = self._get_cached_entry(context_name)
+        tools = entry[1] if entry is not None else await self._fetch_tools(context_name)
 
         return {
             "context": context_name,
             "tools": [{"name": t.name, "description": t.description} for t in tools],
         }
 
-    async def _fetch_tools(self, context_name: str) -> list[ToolInfo]:
-        """Fetch available tools from an MCP server.
+    async def prewarm(self) -> None:
+        """Start every context's server and cache its tools, concurrently.
+
+        Failures are logged by _load_tools and otherwise ignored; those
+        contexts are simply fetched again on first use.
+        """
+        # At most a pool's worth of fetches at a time. This only bounds
+        # concurrency; processes still fetching are kept by _evict_oldest.
+        limit = asyncio.Semaphore(self.max_processes)
+
+        async def warm(context_name: str) -> None:
+            async with limit:
+                await self._fetch_tools(context_name)
+
+        started = time.monotonic()
+        await asyncio.gather(
+            *(warm(name) for name in self.config.contexts),
+            return_exceptions=True,
+        )
+
+        warmed = sum(1 for name in self.config.contexts if name in self._tools_cache)
+        logger.info(
+            f"Prewarmed {warmed}/{len(self.config.contexts)} contexts "
+            f"in {time.monotonic() - started:.2f}s"
+        )
+
+    async def get_or_create_process(self, context_name: str, timeout: float = 30.0) -> ManagedProcess:
+        """Get the running process for a context, spawning it if needed.
 
         Args:
             context_name: Name of the context
+            timeout: Seconds to wait for the pool and for spawning the process
 
         Returns:
-            List of available tools
+            An initialized process for the context
         """
-        # Use cached tools if available
-        if context_name in self._tools_cache:
-            return self._tools_cache[context_name]
+        # Fast path: nothing here awaits, so it can't race other callers
+        process = self._processes.get(context_name)
+        if process is not None and process.alive:
+            self._processes.move_to_end(context_name)
+            return process
 
-        command, args = self.config.get_command(context_name)
-        env = self.config.build_env(context_name)
+        try:
+            return await asyncio.wait_for(
+                self._single_flight(self._spawning, context_name, self._create_process),
+                timeout=timeout
+            )
+        except asyncio.TimeoutError:
+            raise RuntimeError(f"Timeout starting MCP server for {context_name}") from None
+
+    async def _single_flight(
+        self,
+        inflight: dict[str, asyncio.Task[T]],
+        key: str,
+        func: Callable[[str], Awaitable[T]]
+    ) -> T:
+        """Run func(key) once for all concurrent callers asking for the same key.
+
+        Callers share one task; cancelling a caller doesn't cancel it.
+        """
+        task = inflight.get(key)
+        if task is None:
+            task = inflight[key] = asyncio.create_task(func(key))
+            task.add_done_callback(functools.partial(self._single_flight_done, inflight, key))
 
         try:
-            # Initialize first
-            init_request = {
-                "jsonrpc": "2.0",
-                "id": 0,
-                "method": "initialize",
-                "params": {
-                    "protocolVersion": "2024-11-05",
-                    "capabilities": {},
-                    "clientInfo": {"name": "mcp-env-proxy", "version": "0.1.0"}
-                }
-            }
+            return await asyncio.shield(task)
+        except asyncio.CancelledError:
+            # The shared task was cancelled by close(), not this caller; a
+            # bare CancelledError would read as the caller being cancelled
+            if task.cancelled() and not _cancelling():
+                raise RuntimeError(f"Process pool was closed while handling {key}") from None
+            raise
+
+    @staticmethod
+    def _single_flight_done(inflight: dict[str, asyncio.Task], key: str, task: asyncio.Task) -> None:
+        if inflight.get(key) is task:
+            del inflight[key]
+        # Callers may all have given up; mark the exception as retrieved
+        if not task.cancelled():
+            task.exception()
+
+    async def _create_process(self, context_name: str) -> ManagedProcess:
+        """Spawn a context's process and add it to the pool, evicting if full.
+
+        Only one spawn per context runs at a time (see get_or_create_process),
+        while different contexts spawn concurrently.
+        """
+        process = await self._spawn_process(context_name)
 
-            tools_request = {
-                "jsonrpc": "2.0",
-                "id": 1,
-                "method": "tools/list",
-                "params": {}
-            }
+        # Updating the pool doesn't await, so it can't interleave with other
+        # callers; replaced and evicted processes are stopped afterwards
+        retired = []
+        previous = self._processes.pop(context_name, None)
+        if previous is not None:
+            logger.warning(f"MCP server for {context_name} exited, replaced it")
+            retired.append(previous)
 
-            result = await self._call_mcp_interactive(
-                command, args, env,
-                [init_request, tools_request],
-                expected_responses=2
-            )
+        while len(self._processes) >= self.max_processes:
+            evicted = self._evict_oldest()
+            if evicted is None:
+                break
+            retired.append(evicted)
 
-            # Look for tools/list response (id=1)
-            for resp in result:
-                if resp.get("id") == 1 and "result" in resp:
-                    tools_data = resp["result"].get("tools", [])
-                    return [
-                        ToolInfo(
-                            name=t["name"],
-                            description=t.get("description"),
-                            input_schema=t.get("inputSchema")
-                        )
-                        for t in tools_data
-                    ]
+        self._processes[context_name] = process
 
-        except Exception as e:
-            logger.error(f"Failed to fetch tools for {context_name}: {e}")
+        await asyncio.gather(*(self._stop(p) for p in retired), return_exceptions=True)
+        return process
+
+    async def _spawn_process(self, context_name: str) -> ManagedProcess:
+        """Start an MCP server for a context and run the initialize handshake.
+
+        Args:
+            context_name: Name of the context
+
+        Returns:
+            The initialized process
+        """
+        command, args = self.config.get_command(context_name)
+        env = self.config.build_spawn_env(context_name)
+
+        logger.debug(f"Spawning MCP server for {context_name}: {command} {args}")
 
-        return []
+        try:
+            proc = await self._start_subprocess(command, args, env)
+        except OSError as e:
+            raise RuntimeError(f"Failed to start MCP server for {context_name}: {e}") from e
 
-    async def _call_mcp_interactive(
+        process = ManagedProcess(context_name=context_name, proc=proc)
+        process.reader_task = asyncio.create_task(self._read_responses(process))
+        process.stderr_task = asyncio.create_task(self._drain_stderr(process))
+
+        try:
+            resp = await self._send_request(process, _INITIALIZE_ID, _INITIALIZE_REQUEST, "initialize")
+            if "error" in resp:
+                raise RuntimeError(f"MCP server initialize failed: {resp['error']}")
+            process.proc.stdin.write(_INITIALIZED_NOTIFICATION)
+        except BaseException:
+            await self._stop(process)
+            raise
+
+        logger.info(f"Started MCP server for context: {context_name}")
+        return process
+
+    async def _start_subprocess(
         self,
         command: str,
         args: list[str],
-        env: dict[str, str],
-        requests: list[dict],
-        expected_responses: int = 1,
-        timeout: float = 30.0
-    ) -> list[dict]:
-        """Call an MCP server interactively, reading responses as they arrive.
+        env: dict[str, str] | dict[bytes, bytes]
+    ) -> asyncio.subprocess.Process | _ThreadSpawnedProcess:
+        """Start a server process with piped stdin, stdout and stderr.
+
+        asyncio.create_subprocess_exec forks and execs on the event loop
+        thread, stalling every other coroutine while it does. On POSIX the
+        process is started from a worker thread instead and its pipes are
+        then attached to the loop. Windows keeps the asyncio implementation,
+        as plain subprocess pipes can't be attached to its proactor loop.
+        """
+        if sys.platform == "win32":
+            return await asyncio.create_subprocess_exec(
+                command, *args,
+                stdin=asyncio.subprocess.PIPE,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+                env=env,
+                limit=_STDOUT_LIMIT,
+            )
 
-        Args:
-            command: Command to run
-            args: Command arguments
-            env: Environment variables
-            requests: List of JSON-RPC requests to send
-            expected_responses: Number of responses to wait for
-            timeout: Overall timeout in seconds
+        if self._spawn_executor is None:
+            self._spawn_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="mcp-spawn")
+
+        loop = asyncio.get_running_loop()
+        popen = await loop.run_in_executor(self._spawn_executor, lambda: subprocess.Popen(
+            [command, *args],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            env=env,
+        ))
+
+        try:
+            stdout = asyncio.StreamReader(limit=_STDOUT_LIMIT)
+            await loop.connect_read_pipe(lambda: asyncio.StreamReaderProtocol(stdout), popen.stdout)
+            stderr = asyncio.StreamReader()
+            await loop.connect_read_pipe(lambda: asyncio.StreamReaderProtocol(stderr), popen.stderr)
+            transport, protocol = await loop.connect_write_pipe(asyncio.streams.FlowControlMixin, popen.stdin)
+        except BaseException:
+            popen.kill()
+            raise
+
+        stdin = asyncio.StreamWriter(transport, protocol, None, loop)
+        return _ThreadSpawnedProcess(popen, stdin, stdout, stderr)
+
+    def _evict_oldest(self) -> ManagedProcess | None:
+        """Remove the least recently used idle process not serving the current context.
+
+        Processes with requests in flight are skipped, so the pool may run
+        over max_processes until they are idle again.
 
         Returns:
-            List of JSON-RPC responses
+            The removed process, which the caller must stop, or None
         """
-        logger.debug(f"Calling MCP server: {command} {args}")
+        for name, process in self._processes.items():
+            if name != self._current_context and not process.pending:
+                break
+        else:
+            return None
+
+        logger.info(f"Evicting process for context: {name}")
+        return self._processes.pop(name)
+
+    async def _stop(self, process: ManagedProcess) -> None:
+        """Stop a process: close stdin, then escalate to SIGTERM and SIGKILL."""
+        proc = process.proc
+        if proc.returncode is None:
+            proc.stdin.close()
+            try:
+                await asyncio.wait_for(proc.wait(), timeout=2.0)
+            except asyncio.TimeoutError:
+                proc.terminate()
+                try:
+                    await asyncio.wait_for(proc.wait(), timeout=2.0)
+                except asyncio.TimeoutError:
+                    proc.kill()
+                    await proc.wait()
 
-        proc = await asyncio.create_subprocess_exec(
-            command, *args,
-            stdin=asyncio.subprocess.PIPE,
-            stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE,
-            env=env,
+        if process.reader_task is not None:
+            process.reader_task.cancel()
+        if process.stderr_task is not None:
+            process.stderr_task.cancel()
+
+    async def close(self) -> None:
+        """Stop all pooled processes concurrently.
+
+        The pool stays usable: later calls spawn processes again.
+        """
+        # Cancelled spawns stop their own process
+        spawning = list(self._spawning.values())
+        for task in spawning:
+            task.cancel()
+
+        processes = list(self._processes.values())
+        self._processes.clear()
+
+        await asyncio.gather(
+            *spawning,
+            *(self._stop(p) for p in processes),
+            return_exceptions=True,
         )
+        if self._spawn_executor is not None:
+            self._spawn_executor.shutdown(wait=False, cancel_futures=True)
+            self._spawn_executor = None
+
+    async def _send_request(
+        self,
+        process: ManagedProcess,
+        request_id: int,
+        payload: bytes,
+        method: str,
+        timeout: float = 30.0
+    ) -> dict:
+        """Write a serialized JSON-RPC request and wait for its response.
+
+        Args:
+            process: Process to send the request to
+            request_id: JSON-RPC id the payload was serialized with
+            payload: The request as a newline-terminated JSON line
+            method: JSON-RPC method, for logging and errors
+            timeout: Seconds to wait for the response
+
+        Returns:
+            The JSON-RPC response
+        """
+        # A request written now would still run on the server, with its
+        # result (and side effects) reported to nobody
+        if timeout <= 0:
+            raise RuntimeError(f"Timeout before sending {method} to {process.context_name}")
 
-        responses = []
+        future = asyncio.get_running_loop().create_future()
+        process.pending[request_id] = future
 
         try:
-            async def read_responses():
-                """Read JSON responses from stdout."""
-                while len(responses) < expected_responses:
-                    line = await asyncio.wait_for(
-                        proc.stdout.readline(),
-                        timeout=timeout
+            logger.debug(f"Sending request id={request_id} method={method}")
+            process.proc.stdin.write(payload)
+            await process.proc.stdin.drain()
+            return await asyncio.wait_for(future, timeout=timeout)
+        except asyncio.TimeoutError:
+            raise RuntimeError(
+                f"Timeout waiting for {method} response from {process.context_name}"
+            ) from None
+        except ConnectionError as e:
+            raise RuntimeError(f"MCP server for {process.context_name} exited: {e}") from e
+        finally:
+            process.pending.pop(request_id, None)
+
+    async def _read_responses(self, process: ManagedProcess) -> None:
+        """Read JSON responses from a process's stdout and resolve pending requests.
+
+        Reads stdout in large chunks and splits lines locally, which needs
+        far fewer awaits than readline() and has no per-line length limit.
+        Lines are cut out of a single bytearray, so long responses arriving
+        in many chunks are still handled in linear time.
+        """
+        stdout = process.proc.stdout
+        buf = bytearray()
+        try:
+            while chunk := await stdout.read(_STDOUT_LIMIT):
+                # Consume complete lines in place; only the new chunk can hold
+                # a newline that hasn't been seen yet
+                scan = len(buf)
+                buf.extend(chunk)
+                while (nl := buf.find(b"\n", scan)) != -1:
+                    self._dispatch_response(process, buf[:nl])
+                    del buf[:nl + 1]
+                    scan = 0
+
+            if buf:
+                self._dispatch_response(process, buf)
+        except Exception as e:
+            logger.error(f"Failed to read from MCP server for {process.context_name}: {e}")
+        finally:
+            for future in process.pending.values():
+                if not future.done():
+                    future.set_exception(
+                        RuntimeError(f"MCP server for {process.context_name} closed its output")
                     )
-                    if not line:
-                        break
-
-                    line_str = line.decode().strip()
-                    if not line_str or not line_str.startswith("{"):
-                        continue
-
-                    try:
-                        resp = json.loads(line_str)
-                        responses.append(resp)
-                        logger.debug(f"Received response id={resp.get('id')}")
-                    except json.JSONDecodeError:
-                        continue
-
-            # Start reading responses in background
-            read_task = asyncio.create_task(read_responses())
-
-            # Send all requests
-            for req in requests:
-                input_line = json.dumps(req) + "\n"
-                logger.debug(f"Sending request id={req.get('id')}")
-                proc.stdin.write(input_line.encode())
-                await proc.stdin.drain()
-                # Small delay between requests
-                await asyncio.sleep(0.1)
-
-            # Wait for responses with timeout
-            try:
-                await asyncio.wait_for(read_task, timeout=timeout)
-            except asyncio.TimeoutError:
-                logger.warning(f"Timeout waiting for responses, got {len(responses)}/{expected_responses}")
 
-            # Close stdin and terminate
-            proc.stdin.close()
-            try:
-                await asyncio.wait_for(proc.stdin.wait_closed(), timeout=1.0)
-            except asyncio.TimeoutError:
-                pass
+    async def _drain_stderr(self, process: ManagedProcess) -> None:
+        """Forward a process's stderr to the debug log.
 
-            # Kill process
-            try:
-                proc.terminate()
-                await asyncio.wait_for(proc.wait(), timeout=2.0)
-            except asyncio.TimeoutError:
-                proc.kill()
+        stderr must be read continuously: a server blocked on a full stderr
+        pipe stops answering requests.
+        """
+        stderr = process.proc.stderr
+        while chunk := await stderr.read(65536):
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"MCP server {process.context_name} stderr: {chunk[:500].decode(errors='replace')}")
+
+    def _dispatch_response(self, process: ManagedProcess, line: bytes | bytearray) -> None:
+        """Resolve the pending request matching a JSON-RPC response line."""
+        # MCP messages are single-line JSON objects; anything else is chatter.
+        # One byte compare, where lstrip() would copy every line first.
+        if not line or line[0] != 0x7B:  # b"{"
+            return
 
-            return responses
+        try:
+            resp = orjson.loads(line)
+        except orjson.JSONDecodeError:
+            return
 
-        except Exception as e:
-            proc.kill()
-            raise RuntimeError(f"MCP server error: {e}")
+        # Requests and notifications from the server have their own ids,
+        # which can collide with ours; only responses resolve requests
+        if "method" in resp:
+            return
+
+        # Our ids are ints; anything else (possibly unhashable) isn't ours
+        request_id = resp.get("id")
+        if type(request_id) is not int:
+            return
+
+        future = process.pending.get(request_id)
+        if future is not None and not future.done():
+            logger.debug(f"Received response id={request_id}")
+            future.set_result(resp)
+
+    async def _fetch_tools(self, context_name: str) -> list[ToolInfo]:
+        """Fetch available tools from an MCP server.
+
+        Successful fetches are cached; a failed fetch is retried on the
+        next call.
+
+        Args:
+            context_name: Name of the context
 
-    async def call_tool(self, tool_name: str, arguments: dict[str, Any]) -> Any:
+        Returns:
+            List of available tools
+
+        Raises:
+            ToolFetchError: If the server can't be started or doesn't list
+                its tools
+        """
+        # Use cached tools if available
+        entry = self._get_cached_entry(context_name)
+        if entry is not None:
+            return entry[1]
+
+        return await self._single_flight(self._fetching, context_name, self._load_tools)
+
+    async def _load_tools(self, context_name: str) -> list[ToolInfo]:
+        """Request a context's tools from its server and cache them."""
+        timeout = 30.0
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+
+        try:
+            process = await self.get_or_create_process(context_name, timeout=timeout)
+            request_id = process.new_request_id()
+            resp = await self._send_request(
+                process,
+                request_id,
+                _TOOLS_LIST_REQUEST % request_id,
+                "tools/list",
+                timeout=deadline - loop.time()
+            )
+
+            if "result" in resp:
+                tools_data = resp["result"].get("tools", [])
+                tools = [
+                    ToolInfo(
+                        name=t["name"],
+                        description=t.get("description"),
+                        input_schema=t.get("inputSchema")
+                    )
+                    for t in tools_data
+                ]
+                self._cache_tools(context_name, tools)
+                return tools
+
+            raise RuntimeError(f"tools/list failed: {resp.get('error')}")
+
+        except (asyncio.TimeoutError, RuntimeError, OSError) as e:
+            error = ToolFetchError(context_name, e)
+            logger.error(str(error))
+            raise error from e
+
+    def _get_cached_entry(
+        self, context_name: str
+    ) -> tuple[float, list[ToolInfo], list[dict[str, Any]]] | None:
+        """Get a context's tools cache entry, or None if missing or expired."""
+        entry = self._tools_cache.get(context_name)
+        if entry is None:
+            return None
+
+        if time.monotonic() - entry[0] >= self.tools_ttl:
+            del self._tools_cache[context_name]
+            return None
+
+        self._tools_cache.move_to_end(context_name)
+        return entry
+
+    def _cache_tools(self, context_name: str, tools: list[ToolInfo]) -> None:
+        """Cache a context's tools, evicting the least recently used past the limit."""
+        tool_dicts = [
+            {
+                "name": t.name,
+                "description": t.description,
+                "input_schema": t.input_schema,
+            }
+            for t in tools
+        ]
+        self._tools_cache[context_name] = (time.monotonic(), tools, tool_dicts)
+        self._tools_cache.move_to_end(context_name)
+        while len(self._tools_cache) > self.max_cached_tools:
+            self._tools_cache.popitem(last=False)
+
+    def invalidate(self, context_name: str) -> None:
+        """Drop a context's cached tools so the next use fetches them again."""
+        self._tools_cache.pop(context_name, None)
+
+    async def call_tool(self, tool_name: str, arguments: dict[str, Any], timeout: float = 60.0) -> Any:
         """Call a tool on the current context's MCP server.
 
         Args:
             tool_name: Name of the tool to call
             arguments: Tool arguments
+            timeout: Overall timeout in seconds, including spawning the
+                server if it is not running
 
         Returns:
             Tool result
@@ -234,45 +693,25 @@ class ProcessPool:
         if self._current_context is None:
             raise RuntimeError("No active context. Use switch_context first.")
 
-        context_name = self._current_context
-        command, args = self.config.get_command(context_name)
-        env = self.config.build_env(context_name)
-
-        init_request = {
-            "jsonrpc": "2.0",
-            "id": 0,
-            "method": "initialize",
-            "params": {
-                "protocolVersion": "2024-11-05",
-                "capabilities": {},
-                "clientInfo": {"name": "mcp-env-proxy", "version": "0.1.0"}
-            }
-        }
-
-        tool_request = {
-            "jsonrpc": "2.0",
-            "id": 1,
-            "method": "tools/call",
-            "params": {
-                "name": tool_name,
-                "arguments": arguments
-            }
-        }
-
-        responses = await self._call_mcp_interactive(
-            command, args, env,
-            [init_request, tool_request],
-            expected_responses=2,
-            timeout=60.0  # Longer timeout for tool calls
+        # One deadline for the whole call, so a cold start can't stack its
+        # own timeout on top of the tool call's
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+
+        process = await self.get_or_create_process(self._current_context, timeout=timeout)
+        request_id = process.new_request_id()
+        resp = await self._send_request(
+            process,
+            request_id,
+            _TOOLS_CALL_REQUEST % (request_id, orjson.dumps(tool_name), orjson.dumps(arguments)),
+            "tools/call",
+            timeout=deadline - loop.time()
         )
 
-        # Look for tools/call response (id=1)
-        for resp in responses:
-            if resp.get("id") == 1:
-                if "result" in resp:
-                    return resp["result"]
-                elif "error" in resp:
-                    raise RuntimeError(f"Tool error: {resp['error']}")
+        if "result" in resp:
+            return resp["result"]
+        elif "error" in resp:
+            raise RuntimeError(f"Tool error: {resp['error']}")
 
         raise RuntimeError("No response received for tool call")
 
@@ -285,12 +724,27 @@ class ProcessPool:
         if self._current_context is None:
             return []
 
-        if self._current_context in self._tools_cache:
-            return self._tools_cache[self._current_context]
+        return await self._fetch_tools(self._current_context)
+
+    async def list_tool_schemas(self) -> list[dict[str, Any]]:
+        """List tools of the current context as name/description/input_schema dicts.
 
-        tools = await self._fetch_tools(self._current_context)
-        self._tools_cache[self._current_context] = tools
-        return tools
+        The list is built once per fetch and cached with the tools, so it
+        is shared between callers and must not be modified.
+
+        Returns:
+            List of tool dicts
+        """
+        context_name = self._current_context
+        if context_name is None:
+            return []
+
+        entry = self._get_cached_entry(context_name)
+        if entry is None:
+            await self._fetch_tools(context_name)
+            entry = self._tools_cache.get(context_name)
+
+        return entry[2] if entry is not None else []
 
     def list_contexts(self) -> list[dict[str, Any]]:
         """List all available contexts.
@@ -298,15 +752,15 @@ class ProcessPool:
         Returns:
             List of context info dicts
         """
-        contexts = []
-        for name, ctx in self.config.contexts.items():
-            server = self.config.get_server(ctx.server)
-            contexts.append({
-                "name": name,
-                "server": ctx.server,
-                "command": f"{server.command} {' '.join(server.args)}" if server else "unknown",
-                "env": ctx.env,
-                "active": name == self._current_context,
-                "loaded": name in self._tools_cache,
-            })
-        return contexts
+        # Expired entries don't count as loaded; listing leaves the cache
+        # and its LRU order untouched
+        expired_before = time.monotonic() - self.tools_ttl
+        cache = self._tools_cache
+        return [
+            {
+                **info,
+                "active": info["name"] == self._current_context,
+                "loaded": (entry := cache.get(info["name"])) is not None and entry[0] > expired_before,
+            }
+            for info in self._context_info
+        ]
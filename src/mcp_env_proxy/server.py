@@ -1,6 +1,9 @@
 """FastMCP server for the environment proxy."""
 
+import asyncio
 import logging
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 from typing import Any
 
 from mcp.server.fastmcp import FastMCP
@@ -20,11 +23,41 @@ def create_server(config: ProxyConfig) -> FastMCP:
     Returns:
         FastMCP server instance
     """
-    mcp = FastMCP(name="mcp-env-proxy")
-
     # Initialize the process pool
     pool = ProcessPool(config)
 
+    # Handlers call these directly rather than looking them up on the pool
+    _list_contexts = pool.list_contexts
+    _switch = pool.switch_context
+    _list_tools = pool.list_tools
+    _list_tool_schemas = pool.list_tool_schemas
+    _call_tool = pool.call_tool
+
+    # FastMCP enters the lifespan once per client session (every SSE or
+    # HTTP connection), while the pool is shared by all of them: it is
+    # prewarmed when the first session starts and closed after the last ends
+    sessions = 0
+    prewarm_task: asyncio.Task[None] | None = None
+
+    @asynccontextmanager
+    async def lifespan(server: FastMCP) -> AsyncIterator[None]:
+        nonlocal sessions, prewarm_task
+        sessions += 1
+        if sessions == 1 and config.prewarm:
+            # In the background, so the proxy answers its client right away
+            prewarm_task = asyncio.create_task(pool.prewarm())
+        try:
+            yield
+        finally:
+            sessions -= 1
+            if sessions == 0:
+                if prewarm_task is not None:
+                    prewarm_task.cancel()
+                    prewarm_task = None
+                await pool.close()
+
+    mcp = FastMCP(name="mcp-env-proxy", lifespan=lifespan)
+
     @mcp.tool()
     async def list_contexts() -> list[dict[str, Any]]:
         """List all available contexts.
@@ -32,7 +65,7 @@ def create_server(config: ProxyConfig) -> FastMCP:
         Returns a list of contexts with their configuration,
         showing which is currently active and which have cached tools.
         """
-        return pool.list_contexts()
+        return _list_contexts()
 
     @mcp.tool()
     async def switch_context(context_name: str) -> dict[str, Any]:
@@ -47,7 +80,7 @@ def create_server(config: ProxyConfig) -> FastMCP:
         Returns:
             Information about the new active context including available tools
         """
-        return await pool.switch_context(context_name)
+        return await _switch(context_name)
 
     @mcp.tool()
     async def get_current_context() -> dict[str, Any]:
@@ -61,7 +94,7 @@ def create_server(config: ProxyConfig) -> FastMCP:
             return {"context": None, "message": "No context active"}
 
         ctx = config.get_context(ctx_name)
-        tools = await pool.list_tools()
+        tools = await _list_tools()
 
         return {
             "context": ctx_name,
@@ -86,11 +119,7 @@ def create_server(config: ProxyConfig) -> FastMCP:
         Returns:
             Result from the proxied tool
         """
-        if arguments is None:
-            arguments = {}
-
-        result = await pool.call_tool(tool_name, arguments)
-        return result
+        return await _call_tool(tool_name, arguments or {})
 
     @mcp.tool()
     async def list_proxied_tools() -> list[dict[str, Any]]:
@@ -99,17 +128,6 @@ def create_server(config: ProxyConfig) -> FastMCP:
         Returns:
             List of tools with their names and descriptions
         """
-        tools = await pool.list_tools()
-        return [
-            {
-                "name": t.name,
-                "description": t.description,
-                "input_schema": t.input_schema,
-            }
-            for t in tools
-        ]
-
-    # Store pool reference for cleanup
-    mcp._pool = pool
+        return await _list_tool_schemas()
 
     return mcp
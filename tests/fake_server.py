@@ -0,0 +1,86 @@
+"""Minimal stdio MCP server used by the pool tests.
+
+Speaks just enough JSON-RPC for ProcessPool: initialize, tools/list and
+tools/call. Calls run in threads, so slow calls overlap and responses can
+come back out of order. Behaviour is tweaked through environment variables:
+
+    FAKE_TOOLS_ERROR  answer tools/list with a JSON-RPC error
+    FAKE_CHATTER      before answering tools/list, send a server-to-client
+                      ping with id 1 and a response with an unhashable id
+"""
+
+import json
+import os
+import sys
+import threading
+import time
+
+_write_lock = threading.Lock()
+
+TOOLS = [
+    {"name": "echo", "description": "Echo the arguments", "inputSchema": {"type": "object"}},
+    {"name": "env", "description": "Read an environment variable", "inputSchema": {"type": "object"}},
+    {"name": "slow", "description": "Sleep, then answer", "inputSchema": {"type": "object"}},
+    {"name": "crash", "description": "Exit immediately", "inputSchema": {"type": "object"}},
+]
+
+
+def send(message: dict) -> None:
+    with _write_lock:
+        sys.stdout.write(json.dumps(message) + "\n")
+        sys.stdout.flush()
+
+
+def text(request_id, value: str) -> None:
+    send({"jsonrpc": "2.0", "id": request_id, "result": {"content": [{"type": "text", "text": value}]}})
+
+
+def call_tool(request_id, name: str, arguments: dict) -> None:
+    if name == "echo":
+        text(request_id, json.dumps(arguments, sort_keys=True))
+    elif name == "env":
+        text(request_id, f"{os.environ.get(arguments['name'])} pid={os.getpid()}")
+    elif name == "slow":
+        time.sleep(arguments.get("s", 1.0))
+        text(request_id, "done")
+    elif name == "crash":
+        os._exit(1)
+    else:
+        send({"jsonrpc": "2.0", "id": request_id, "error": {"code": -32601, "message": f"Unknown tool: {name}"}})
+
+
+def main() -> None:
+    for line in sys.stdin:
+        message = json.loads(line)
+        method = message.get("method")
+        request_id = message.get("id")
+
+        if method == "initialize":
+            send({
+                "jsonrpc": "2.0",
+                "id": request_id,
+                "result": {
+                    "protocolVersion": "2024-11-05",
+                    "capabilities": {"tools": {}},
+                    "serverInfo": {"name": "fake", "version": "0"},
+                },
+            })
+        elif method == "tools/list":
+            if os.environ.get("FAKE_CHATTER"):
+                send({"jsonrpc": "2.0", "id": 1, "method": "ping"})
+                send({"jsonrpc": "2.0", "id": [request_id], "result": {}})
+            if os.environ.get("FAKE_TOOLS_ERROR"):
+                send({"jsonrpc": "2.0", "id": request_id, "error": {"code": -32603, "message": "no tools"}})
+            else:
+                send({"jsonrpc": "2.0", "id": request_id, "result": {"tools": TOOLS}})
+        elif method == "tools/call":
+            params = message["params"]
+            threading.Thread(
+                target=call_tool,
+                args=(request_id, params["name"], params.get("arguments") or {}),
+                daemon=True,
+            ).start()
+
+
+if __name__ == "__main__":
+    main()
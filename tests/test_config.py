@@ -0,0 +1,185 @@
+"""Tests for configuration loading and validation."""
+
+import os
+
+import pytest
+
+from mcp_env_proxy.config import ProxyConfig, _parse_yaml
+
+VALID = {
+    "defaults": {"LOG_LEVEL": "ERROR", "RETRIES": 3},
+    "servers": {"eks": {"command": "uvx", "args": ["eks-server@latest", "--port", 8080]}},
+    "contexts": {
+        "prod": {
+            "server": "eks",
+            "env": {"AWS_PROFILE": "prod", "LOG_LEVEL": "DEBUG"},
+            "description": "Production",
+        },
+    },
+    "current_context": "prod",
+    "prewarm": True,
+}
+
+YAML = """\
+defaults:
+  LOG_LEVEL: ERROR
+servers:
+  eks:
+    command: uvx
+    args: ["eks-server@latest"]
+contexts:
+  prod:
+    server: eks
+    env:
+      AWS_PROFILE: {profile}
+current_context: prod
+"""
+
+
+@pytest.fixture(autouse=True)
+def clear_yaml_cache():
+    _parse_yaml.cache_clear()
+    yield
+    _parse_yaml.cache_clear()
+
+
+def with_changes(**changes) -> dict:
+    """Copy VALID, replacing values at dotted paths."""
+    data = {
+        **VALID,
+        "servers": {"eks": dict(VALID["servers"]["eks"])},
+        "contexts": {"prod": dict(VALID["contexts"]["prod"])},
+    }
+    for path, value in changes.items():
+        *parents, key = path.split("__")
+        target = data
+        for parent in parents:
+            target = target[parent]
+        target[key] = value
+    return data
+
+
+def test_from_dict_valid():
+    config = ProxyConfig.from_dict(VALID)
+
+    assert config.defaults == {"LOG_LEVEL": "ERROR", "RETRIES": "3"}
+    assert config.get_command("prod") == ("uvx", ["eks-server@latest", "--port", "8080"])
+    assert config.get_context("prod").description == "Production"
+    assert config.current_context == "prod"
+    assert config.prewarm is True
+
+
+def test_from_dict_empty():
+    config = ProxyConfig.from_dict({})
+
+    assert config.servers == {}
+    assert config.contexts == {}
+    assert config.current_context is None
+    assert config.prewarm is False
+
+
+@pytest.mark.parametrize("data", [
+    ["not", "a", "mapping"],
+    with_changes(servers=["eks"]),
+    with_changes(contexts=["prod"]),
+    with_changes(servers__eks={"args": []}),
+    with_changes(servers__eks__command=None),
+    with_changes(servers__eks__command=5),
+    with_changes(servers__eks__args="--version"),
+    with_changes(servers__eks__args=[{"a": 1}]),
+    with_changes(servers__eks__args=[None]),
+    with_changes(contexts__prod__server=None),
+    with_changes(contexts__prod__env={"AWS_PROFILE": None}),
+    with_changes(contexts__prod__env={"AWS_PROFILE": True}),
+    with_changes(contexts__prod__env={"AWS_PROFILE": ["a"]}),
+    with_changes(contexts__prod__env=["AWS_PROFILE"]),
+    with_changes(contexts__prod__description=5),
+    with_changes(defaults={"LOG_LEVEL": None}),
+    with_changes(current_context=5),
+    with_changes(prewarm="false"),
+], ids=lambda data: repr(data)[:60])
+def test_from_dict_rejects_malformed(data):
+    with pytest.raises(ValueError):
+        ProxyConfig.from_dict(data)
+
+
+def test_build_env_layers_context_over_defaults(monkeypatch):
+    monkeypatch.setenv("MCP_ENV_PROXY_TEST", "from-os")
+    config = ProxyConfig.from_dict(VALID)
+
+    env = config.build_env("prod")
+
+    assert env["MCP_ENV_PROXY_TEST"] == "from-os"
+    assert env["RETRIES"] == "3"
+    assert env["LOG_LEVEL"] == "DEBUG"
+    assert config.build_env("prod") is env
+
+
+@pytest.mark.skipif(not os.supports_bytes_environ, reason="no bytes environment on this platform")
+def test_build_spawn_env_matches_build_env(monkeypatch):
+    monkeypatch.setenv("MCP_ENV_PROXY_TEST", "from-os")
+    config = ProxyConfig.from_dict(VALID)
+
+    env = config.build_spawn_env("prod")
+
+    assert env[b"MCP_ENV_PROXY_TEST"] == b"from-os"
+    assert env[b"LOG_LEVEL"] == b"DEBUG"
+    assert env == {os.fsencode(k): os.fsencode(v) for k, v in config.build_env("prod").items()}
+    assert config.build_spawn_env("prod") is env
+
+
+@pytest.mark.skipif(os.supports_bytes_environ, reason="only on platforms without a bytes environment")
+def test_build_spawn_env_falls_back_to_str_env():
+    config = ProxyConfig.from_dict(VALID)
+
+    assert config.build_spawn_env("prod") is config.build_env("prod")
+
+
+def test_build_spawn_env_unknown_context():
+    with pytest.raises(ValueError):
+        ProxyConfig.from_dict(VALID).build_spawn_env("nope")
+
+
+def test_load_reuses_parse_until_file_changes(tmp_path):
+    path = tmp_path / "contexts.yaml"
+    path.write_text(YAML.format(profile="first"))
+
+    first = ProxyConfig.load(path)
+    second = ProxyConfig.load(path)
+
+    assert _parse_yaml.cache_info().hits == 1
+    assert first.contexts["prod"].env == second.contexts["prod"].env == {"AWS_PROFILE": "first"}
+
+    # Same size as before; only the mtime tells the two versions apart
+    stat = path.stat()
+    path.write_text(YAML.format(profile="other"))
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    third = ProxyConfig.load(path)
+
+    assert _parse_yaml.cache_info().misses == 2
+    assert third.contexts["prod"].env == {"AWS_PROFILE": "other"}
+
+
+def test_load_does_not_share_state_between_configs(tmp_path):
+    path = tmp_path / "contexts.yaml"
+    path.write_text(YAML.format(profile="first"))
+
+    first = ProxyConfig.load(path)
+    first.contexts["prod"].env["AWS_PROFILE"] = "mutated"
+
+    assert ProxyConfig.load(path).contexts["prod"].env == {"AWS_PROFILE": "first"}
+
+
+def test_load_missing_file(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        ProxyConfig.load(tmp_path / "missing.yaml")
+
+
+def test_load_rejects_malformed_file(tmp_path):
+    path = tmp_path / "contexts.yaml"
+    path.write_text("servers:\n  eks:\n    command: echo\n    args: --version\n")
+
+    with pytest.raises(ValueError):
+        ProxyConfig.load(path)
+
@@ -0,0 +1,236 @@
+"""Tests for ProcessPool against a fake stdio MCP server."""
+
+import asyncio
+import sys
+from pathlib import Path
+
+import pytest
+
+from mcp_env_proxy.config import ProxyConfig
+from mcp_env_proxy.pool import ProcessPool, ToolFetchError
+
+FAKE_SERVER = str(Path(__file__).with_name("fake_server.py"))
+
+
+def make_config(contexts: dict[str, dict[str, str]], current_context: str | None = None) -> ProxyConfig:
+    """Build a config whose contexts all run the fake server with the given env."""
+    return ProxyConfig.from_dict({
+        "servers": {
+            "fake": {"command": sys.executable, "args": [FAKE_SERVER]},
+            "missing": {"command": "/nonexistent/mcp-server"},
+        },
+        "contexts": {
+            name: {
+                "server": env.get("server", "fake"),
+                "env": {k: v for k, v in env.items() if k != "server"},
+            }
+            for name, env in contexts.items()
+        },
+        "current_context": current_context,
+    })
+
+
+@pytest.fixture
+async def make_pool():
+    pools = []
+
+    def factory(contexts: dict[str, dict[str, str]], current_context: str | None = None, **kwargs) -> ProcessPool:
+        pool = ProcessPool(make_config(contexts, current_context), **kwargs)
+        pools.append(pool)
+        return pool
+
+    yield factory
+
+    for pool in pools:
+        await pool.close()
+
+
+def text(result: dict) -> str:
+    return result["content"][0]["text"]
+
+
+async def test_switch_context_lists_tools(make_pool):
+    pool = make_pool({"a": {}})
+
+    info = await pool.switch_context("a")
+
+    assert info["context"] == "a"
+    assert [t["name"] for t in info["tools"]] == ["echo", "env", "slow", "crash"]
+    assert pool.current_context == "a"
+
+
+async def test_context_env_reaches_server(make_pool):
+    pool = make_pool({"a": {"AWS_PROFILE": "prof-a"}, "b": {"AWS_PROFILE": "prof-b"}})
+
+    await pool.switch_context("a")
+    result_a = text(await pool.call_tool("env", {"name": "AWS_PROFILE"}))
+    await pool.switch_context("b")
+    result_b = text(await pool.call_tool("env", {"name": "AWS_PROFILE"}))
+
+    assert result_a.startswith("prof-a ")
+    assert result_b.startswith("prof-b ")
+
+
+async def test_process_is_reused_across_calls(make_pool):
+    pool = make_pool({"a": {}}, current_context="a")
+
+    first = text(await pool.call_tool("env", {"name": "HOME"}))
+    second = text(await pool.call_tool("env", {"name": "HOME"}))
+
+    assert first.split("pid=")[1] == second.split("pid=")[1]
+
+
+async def test_concurrent_calls_are_matched_by_id(make_pool):
+    pool = make_pool({"a": {}}, current_context="a")
+
+    slow = asyncio.create_task(pool.call_tool("slow", {"s": 0.3}))
+    echoes = await asyncio.gather(*(pool.call_tool("echo", {"n": n}) for n in range(20)))
+
+    # The echoes were answered while the slow call was still running
+    assert not slow.done()
+    assert [text(r) for r in echoes] == [f'{{"n": {n}}}' for n in range(20)]
+    assert text(await slow) == "done"
+
+
+async def test_server_requests_do_not_resolve_pending_requests(make_pool):
+    # The server sends a ping with id 1 (the id of our tools/list) and a
+    # response with an unhashable id before answering
+    pool = make_pool({"a": {"FAKE_CHATTER": "1"}})
+
+    info = await pool.switch_context("a")
+
+    assert len(info["tools"]) == 4
+    assert text(await pool.call_tool("echo", {"ok": True})) == '{"ok": true}'
+
+
+async def test_tool_error_raises(make_pool):
+    pool = make_pool({"a": {}}, current_context="a")
+
+    with pytest.raises(RuntimeError, match="Tool error"):
+        await pool.call_tool("nope", {})
+
+
+async def test_concurrent_fetches_share_one_spawn(make_pool):
+    pool = make_pool({"a": {}}, current_context="a")
+
+    results = await asyncio.gather(*(pool.list_tools() for _ in range(5)))
+
+    assert all(tools is results[0] for tools in results)
+    assert list(pool._processes) == ["a"]
+
+
+async def test_idle_process_is_evicted(make_pool):
+    pool = make_pool({"a": {}, "b": {}, "c": {}}, max_processes=2)
+
+    for name in ("a", "b", "c"):
+        await pool.switch_context(name)
+
+    assert list(pool._processes) == ["b", "c"]
+
+
+async def test_eviction_skips_process_with_request_in_flight(make_pool):
+    pool = make_pool({"a": {}, "b": {}, "c": {}}, max_processes=2)
+
+    await pool.switch_context("a")
+    call = asyncio.create_task(pool.call_tool("slow", {"s": 0.5}))
+    await asyncio.sleep(0.1)
+    await pool.switch_context("b")
+    await pool.switch_context("c")
+
+    assert text(await call) == "done"
+    assert list(pool._processes) == ["a", "c"]
+
+
+async def test_crashed_server_is_respawned(make_pool):
+    pool = make_pool({"a": {}}, current_context="a")
+
+    before = text(await pool.call_tool("env", {"name": "HOME"}))
+    with pytest.raises(RuntimeError, match="closed its output"):
+        await pool.call_tool("crash", {})
+    after = text(await pool.call_tool("env", {"name": "HOME"}))
+
+    assert before.split("pid=")[1] != after.split("pid=")[1]
+    assert list(pool._processes) == ["a"]
+
+
+async def test_fetch_failure_raises_tool_fetch_error(make_pool):
+    pool = make_pool({"a": {"FAKE_TOOLS_ERROR": "1"}})
+
+    with pytest.raises(ToolFetchError) as excinfo:
+        await pool.switch_context("a")
+
+    assert excinfo.value.context_name == "a"
+    assert "no tools" in str(excinfo.value)
+    # Failures aren't cached
+    assert pool.list_contexts()[0]["loaded"] is False
+
+
+async def test_spawn_failure_raises_tool_fetch_error(make_pool):
+    pool = make_pool({"a": {"server": "missing"}})
+
+    with pytest.raises(ToolFetchError) as excinfo:
+        await pool.switch_context("a")
+
+    assert isinstance(excinfo.value.cause, RuntimeError)
+    assert pool.current_context == "a"
+
+
+async def test_expired_tools_are_fetched_again(make_pool):
+    pool = make_pool({"a": {}}, tools_ttl=0.2)
+
+    await pool.switch_context("a")
+    first = await pool.list_tools()
+    assert pool.list_contexts()[0]["loaded"] is True
+    await asyncio.sleep(0.3)
+    assert pool.list_contexts()[0]["loaded"] is False
+
+    assert await pool.list_tools() is not first
+    assert pool.list_contexts()[0]["loaded"] is True
+
+
+async def test_close_stops_all_processes(make_pool):
+    pool = make_pool({"a": {}, "b": {}})
+
+    await pool.switch_context("a")
+    await pool.switch_context("b")
+    procs = [p.proc for p in pool._processes.values()]
+    await pool.close()
+
+    assert not pool._processes
+    assert all(proc.returncode is not None for proc in procs)
+
+
+async def test_pool_is_usable_after_close(make_pool):
+    pool = make_pool({"a": {}}, current_context="a")
+
+    await pool.call_tool("echo", {})
+    await pool.close()
+
+    assert text(await pool.call_tool("echo", {"again": 1})) == '{"again": 1}'
+
+
+async def test_close_during_spawn_raises_instead_of_cancelling(make_pool):
+    pool = make_pool({"a": {}})
+
+    switch = asyncio.create_task(pool.switch_context("a"))
+    while not pool._spawning:
+        await asyncio.sleep(0)
+    await pool.close()
+
+    with pytest.raises(ToolFetchError, match="closed"):
+        await switch
+    assert not switch.cancelled()
+
+
+async def test_cancelled_caller_does_not_cancel_shared_spawn(make_pool):
+    pool = make_pool({"a": {}}, current_context="a")
+
+    first = asyncio.create_task(pool.list_tools())
+    second = asyncio.create_task(pool.list_tools())
+    while not pool._spawning:
+        await asyncio.sleep(0)
+    first.cancel()
+
+    assert len(await second) == 4
+    with pytest.raises(asyncio.CancelledError):
+        await first
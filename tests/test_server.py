@@ -0,0 +1,44 @@
+"""Tests for the FastMCP server wiring."""
+
+import json
+import sys
+from pathlib import Path
+
+from mcp_env_proxy.config import ProxyConfig
+from mcp_env_proxy.server import create_server
+
+FAKE_SERVER = str(Path(__file__).with_name("fake_server.py"))
+
+
+async def call(mcp, name: str, arguments: dict) -> dict:
+    """Call one of the proxy's tools and decode its JSON result."""
+    result = await mcp.call_tool(name, arguments)
+    content = result[0] if isinstance(result, tuple) else result
+    return json.loads(content[0].text)
+
+
+async def whoami(mcp) -> str:
+    result = await call(mcp, "proxy_tool", {"tool_name": "env", "arguments": {"name": "HOME"}})
+    return result["content"][0]["text"].split("pid=")[1]
+
+
+async def test_pool_outlives_all_but_the_last_session():
+    mcp = create_server(ProxyConfig.from_dict({
+        "servers": {"fake": {"command": sys.executable, "args": [FAKE_SERVER]}},
+        "contexts": {"a": {"server": "fake"}, "b": {"server": "fake"}},
+        "current_context": "a",
+    }))
+    server = mcp._mcp_server
+
+    async with server.lifespan(server):
+        async with server.lifespan(server):
+            first = await whoami(mcp)
+        # The other session still uses the same process
+        assert await whoami(mcp) == first
+
+    # The pool was closed with the last session, but a new session can
+    # still spawn servers
+    async with server.lifespan(server):
+        switched = await call(mcp, "switch_context", {"context_name": "b"})
+        assert switched["context"] == "b"
+        assert await whoami(mcp) != first